@@ -0,0 +1,102 @@
+import asyncio
+import time
+from config import ApplicationConfig, Messages
+from utils import ConsoleOutput, ProfileBuilder, SelectorRegistry, NavigationCache
+from signup_bot import SignupBot
+from resource_monitor import MemoryMonitor, BrowserPool
+from metrics import QUEUED_JOBS
+
+class BatchRunner:
+    def __init__(self, playwright, runs, concurrency=ApplicationConfig.BATCH_CONCURRENCY, headless=ApplicationConfig.BATCH_HEADLESS, first_index=1, registry=None, har=None):
+        self.runs = runs
+        self.har = har
+        self.first_index = first_index
+        self.concurrency = concurrency
+        self.monitor = MemoryMonitor()
+        self.pool = BrowserPool(playwright, self.monitor, headless=headless)
+        self.registry = registry or SelectorRegistry()
+        self.navigation = NavigationCache()
+        self.active = 0
+        self.tasks = set()
+        self.results = []
+    
+    async def admit(self):
+        warned = False
+        
+        while self.active >= self.concurrency or not self.monitor.can_admit(self.active):
+            if not warned and self.active < self.concurrency and self.monitor.latest is not None:
+                ConsoleOutput.warn(Messages.WARN_ADMISSION_HELD.format(used=self.monitor.projected_mb(self.active), budget=self.monitor.budget_mb))
+                warned = True
+            await asyncio.wait(self.tasks, timeout=ApplicationConfig.ADMISSION_POLL_INTERVAL, return_when=asyncio.FIRST_COMPLETED)
+    
+    async def run_one(self, index):
+        profile = ProfileBuilder.build(f"{ApplicationConfig.TIMESTAMP}{index:03d}")
+        ConsoleOutput.info(f"{Messages.INFO_RUN_STARTED.format(index=index)} {profile['user_info']['email_user']}@{ApplicationConfig.EMAIL_DOMAIN}")
+        
+        started = time.monotonic()
+        result = {'index': index, 'email_user': profile['user_info']['email_user'], 'ok': False, 'error': None, 'failed_phase': None}
+        bot = SignupBot(profile, self.registry, self.har, self.navigation)
+        browser = None
+        
+        try:
+            browser = await self.pool.acquire()
+            await bot.setup_browser(self.pool.playwright, browser)
+            await bot.run_workflow()
+            result['ok'] = True
+        except Exception as error:
+            result['error'] = str(error)[:200]
+            ConsoleOutput.warn(f"{Messages.WARN_RUN_FAILED.format(index=index)} {result['error']}")
+        finally:
+            result['seconds'] = time.monotonic() - started
+            result['phases'] = dict(bot.phase_timings)
+            result['failed_phase'] = bot.failed_phase
+            if browser is not None:
+                await self.pool.release(browser)
+            self.active -= 1
+        
+        ConsoleOutput.info(Messages.INFO_RUN_FINISHED.format(index=index, seconds=result['seconds']))
+        self.results.append(result)
+        return result
+    
+    async def run(self):
+        ConsoleOutput.info(Messages.INFO_BATCH_START.format(runs=self.runs, concurrency=self.concurrency, budget=self.monitor.budget_mb))
+        monitor_task = asyncio.ensure_future(self.monitor.run(self.pool.recycle_if_leaking))
+        
+        try:
+            for offset in range(self.runs):
+                index = self.first_index + offset
+                QUEUED_JOBS.set(self.runs - offset)
+                await self.admit()
+                self.active += 1
+                self.monitor.note_admission()
+                QUEUED_JOBS.set(self.runs - offset - 1)
+                task = asyncio.ensure_future(self.run_one(index))
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+            
+            if self.tasks:
+                await asyncio.wait(self.tasks)
+        finally:
+            monitor_task.cancel()
+            QUEUED_JOBS.set(0)
+            await self.pool.close_all()
+            self.registry.save()
+        
+        return self.results
+    
+    def print_summary(self):
+        sep = "=" * ApplicationConfig.SEPARATOR_LENGTH
+        succeeded = sum(1 for result in self.results if result['ok'])
+        
+        print(f"\n{sep}")
+        print(f"  {Messages.HEADER_BATCH_SUMMARY}")
+        print(f"{sep}")
+        print(f"  Succeeded : {succeeded}/{len(self.results)}")
+        
+        for result in sorted(self.results, key=lambda r: r['index']):
+            status = "OK" if result['ok'] else f"FAILED  {result['error']}"
+            print(f"    #{result['index']:<4} {result['seconds']:7.1f}s  {status}")
+        
+        peak = self.monitor.peak_summary()
+        if peak:
+            print(f"  {peak}")
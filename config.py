@@ -16,6 +16,29 @@ class ApplicationConfig:
     EMAIL_DOMAIN = "mailinator.com"
     MAILINATOR_INBOX_URL = "https://www.mailinator.com/v4/public/inboxes.jsp?to="
     SEPARATOR_LENGTH = 64
+    SELECTOR_STATS_FILE = "_selector_stats.json"
+    SELECTOR_MIN_TRIES = 5
+    SELECTOR_DEMOTE_RATE = 0.2
+    SELECTOR_REPROBE_INTERVAL = 10
+    NAVIGATION_CACHE_FILE = "_navigation_cache.json"
+    CACHED_NAVIGATION_TIMEOUT_MS = 10000
+    BATCH_CONCURRENCY = 4
+    BATCH_HEADLESS = True
+    MEMORY_BUDGET_MB = 4096
+    RUN_MEMORY_ESTIMATE_MB = 350
+    BROWSER_RECYCLE_MB = 1024
+    MEMORY_SAMPLE_INTERVAL = 2
+    ADMISSION_POLL_INTERVAL = 1
+    METRICS_HOST = "127.0.0.1"
+    METRICS_PORT = 9464
+    LOAD_TEST_STEPS = [1, 2, 4, 8]
+    LOAD_TEST_REPORT_FILE = "load_test_report.json"
+    KNEE_GAIN_THRESHOLD = 0.10
+    KNEE_ERROR_RATE = 0.20
+    TRANSITION_TIMEOUT_MS = 30000
+    HAR_DIRECTORY = "har"
+    HAR_APP_NAME = "app"
+    HAR_INBOX_NAME = "inbox"
 
 class DataPools:
     FIRST_NAMES = ["Pushkar", "Sachin", "Niranjan", "Raj", "Nabin"]
@@ -101,6 +124,10 @@ class Messages:
     HEADER_AGENCY = "AGENCY DETAILS"
     HEADER_EXPERIENCE = "PROFESSIONAL EXPERIENCE"
     HEADER_VERIFICATION = "VERIFICATION & PREFERENCES"
+    HEADER_SELECTOR_STATS = "SELECTOR STRATEGY STATS"
+    HEADER_BATCH_SUMMARY = "BATCH SUMMARY"
+    HEADER_LOAD_STEP = "LOAD TEST  --  concurrency {concurrency}"
+    HEADER_LOAD_SUMMARY = "LOAD TEST SUMMARY"
     SUCCESS_CLICKED = "Clicked"
     SUCCESS_AGREED = "Agreed to Terms & Conditions"
     SUCCESS_CONTINUE = "Clicked Continue"
@@ -115,6 +142,8 @@ class Messages:
     SUCCESS_FINAL_SUBMIT = "FINAL SUBMIT clicked — Signup complete!"
     INFO_NAVIGATING = "Navigating to"
     INFO_SCANNING_LINKS = "Scanning page for visible registration links …"
+    INFO_CACHED_NAVIGATION = "Using cached registration URL"
+    INFO_NAVIGATION_CACHED = "Cached registration URL for next runs:"
     INFO_CLICKING = "Clicking:"
     INFO_WAITING_EMAIL = "Waiting 5 s for email delivery …"
     INFO_DISCOVERING_REGIONS = "Discovering available Regions of Operation …"
@@ -130,6 +159,22 @@ class Messages:
     INFO_SELECTED_COUNTRIES = "Selected countries:"
     INFO_SELECTED_INSTITUTIONS = "Selected institution types:"
     INFO_SELECTING = "Selecting:"
+    INFO_BATCH_START = "Starting batch of {runs} runs (concurrency {concurrency}, memory budget {budget} MB)"
+    INFO_RUN_STARTED = "Run #{index} started:"
+    INFO_RUN_FINISHED = "Run #{index} finished in {seconds:.1f}s"
+    INFO_BROWSER_LAUNCHED = "Launched browser (pid {pid})"
+    INFO_BROWSER_CLOSED = "Closed retired browser (pid {pid})"
+    INFO_LOAD_STEP_RESULT = "{runs} runs in {seconds:.1f}s — {throughput:.2f} runs/min, error rate {error_rate:.0%}"
+    INFO_KNEE_FOUND = "Saturation knee at concurrency {concurrency}: {reason}"
+    INFO_KNEE_NOT_REACHED = "No saturation knee reached up to concurrency {concurrency}"
+    INFO_REPORT_WRITTEN = "Report written to"
+    INFO_TRANSITION = "Page answered: {outcome} after {elapsed:.2f}s"
+    INFO_HAR_RECORDING = "Recording network traffic to"
+    INFO_HAR_LOADED = "Loaded {count} recorded exchanges from {path}"
+    INFO_HAR_OTP_SUBSTITUTED = "Replay inbox will serve OTP {code} in place of recorded {recorded}"
+    INFO_INPUT_STRATEGY = "{key}: '{strategy}' accepted in {ms:.0f} ms"
+    INFO_METRICS_SERVING = "Serving Prometheus metrics on http://{host}:{port}/metrics"
+    INFO_PEAK_MEMORY = "Peak RSS: {total:.0f} MB (driver {driver:.0f}, browser {browser:.0f}, renderers {renderers:.0f} x{count})"
     INFO_AVAILABLE_REGIONS = "Available regions:"
     INFO_AVAILABLE_EXPERIENCE = "Available experience options:"
     INFO_AVAILABLE_SERVICES = "Available services:"
@@ -143,10 +188,24 @@ class Messages:
     WARN_ERROR_DETECTED = "Page error detected:"
     WARN_OTP_INVALID = "OTP expired or invalid — attempting to resend …"
     WARN_NO_RESEND = "No resend button found — retrying fetch anyway"
+    WARN_ADMISSION_HELD = "Memory budget reached ({used:.0f} MB projected, budget {budget} MB) — holding new runs"
+    WARN_BROWSER_RECYCLE = "Browser pid {pid} at {rss:.0f} MB, {excess:.0f} MB not explained by open runs (limit {limit} MB) — recycling"
+    WARN_RUN_FAILED = "Run #{index} failed:"
+    WARN_MONITOR_FAILED = "Memory sample or browser recycle failed, retrying next interval:"
+    WARN_HAR_UNMATCHED = "[{name}] no recorded response for {method} {url}"
+    WARN_HAR_WEBSOCKET_BLOCKED = "[{name}] WebSocket {url} closed — HAR files hold no socket frames"
+    WARN_HAR_NO_MESSAGE_BODY = "No recorded email body with an OTP in {path} — serving the recorded code"
+    WARN_INPUT_STRATEGY_REJECTED = "{key}: '{strategy}' did not read back correctly — trying next strategy"
+    WARN_STALE_NAVIGATION = "Cached registration URL is stale — rediscovering:"
+    WARN_CACHE_UNREADABLE = "Could not read {name}, starting fresh:"
     ERROR_NO_REG_LINK = "Could not discover a visible registration link on the homepage."
     ERROR_NO_OTP = "Could not retrieve OTP after maximum retries — aborting."
     ERROR_VERIFICATION_FAILED = "OTP verification failed after all retry attempts."
     ERROR_VERIFICATION_NO_SUCCESS = "OTP verification did not succeed."
+    ERROR_INPUT_REJECTED = "{key}: no input strategy produced the expected values"
+    ERROR_STEP_REJECTED = "{step} rejected by the page: {detail}"
+    ERROR_STEP_TIMEOUT = "{step}: page did not respond within {seconds:.0f}s"
+    ERROR_HAR_UNREADABLE = "Cannot replay {path}: {error}"
     FINAL_SUCCESS = "SIGNUP AUTOMATION FINISHED  (SUCCESS)"
     FINAL_URL = "Final URL :"
     FINAL_CONTENT = "Page content (first lines):"
@@ -155,4 +214,5 @@ class Messages:
 class Patterns:
     OTP_PATTERN = r"\b(\d{6})\b"
     EMAIL_KEYWORDS = ["otp", "signup", "verif", "confirm", "code"]
-    ERROR_KEYWORDS = ["expired", "invalid"]
\ No newline at end of file
+    ERROR_KEYWORDS = ["expired", "invalid"]
+    ALERT_ERROR_KEYWORDS = ["expired", "invalid", "incorrect", "required", "wrong", "failed", "error", "already", "must", "not match"]
\ No newline at end of file
@@ -0,0 +1,207 @@
+import asyncio
+import base64
+import json
+import os
+import random
+import re
+from collections import deque
+from urllib.parse import urljoin
+from config import ApplicationConfig, Messages, Selectors
+from utils import ConsoleOutput, OTPExtractor
+
+SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+def normalize_url(url):
+    return re.sub(r"\d+", "N", url.split("#")[0])
+
+def strip_query(url):
+    return url.split("#")[0].split("?")[0]
+
+def entry_text(entry):
+    content = entry['response'].get('content', {})
+    if content.get('encoding') == "base64" or "html" not in content.get('mimeType', "").lower():
+        return ""
+    return content.get('text', "")
+
+def visible_text(html):
+    html = re.sub(r"(?is)<(script|style)\b.*?</\1>", " ", html)
+    return re.sub(r"<[^>]+>", " ", html)
+
+def find_message_body(entries):
+    frame_id = Selectors.EMAIL_IFRAME.lstrip("#")
+    iframe_pattern = re.compile(r"<iframe\b[^>]*\bid=[\"']" + re.escape(frame_id) + r"[\"'][^>]*>", re.I)
+    by_url = {entry['request']['url'].split("#")[0]: entry for entry in entries}
+    
+    for entry in entries:
+        iframe = iframe_pattern.search(entry_text(entry))
+        src = re.search(r"\bsrc=[\"']([^\"']+)[\"']", iframe.group(0)) if iframe else None
+        if not src:
+            continue
+        
+        body_entry = by_url.get(urljoin(entry['request']['url'], src.group(1).replace("&amp;", "&")).split("#")[0])
+        code = OTPExtractor.find_code(visible_text(entry_text(body_entry))) if body_entry else None
+        if code:
+            return body_entry, code
+    
+    return None, None
+
+class HarReplayer:
+    def __init__(self, entries, name, latency_ms=0, jitter_ms=0, recorded_timing=False, otp_code=None):
+        self.name = name
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.recorded_timing = recorded_timing
+        self.otp_code = otp_code
+        self.message_entry, self.recorded_code = find_message_body(entries) if otp_code else (None, None)
+        self.exact = {}
+        self.by_path = {}
+        self.by_shape = {}
+        
+        for entry in entries:
+            method = entry['request']['method']
+            url = entry['request']['url'].split("#")[0]
+            self.exact.setdefault((method, url), deque()).append(entry)
+            self.by_path.setdefault((method, strip_query(url)), deque()).append(entry)
+            self.by_shape.setdefault((method, normalize_url(url)), deque()).append(entry)
+    
+    @staticmethod
+    def take(queue):
+        if len(queue) > 1:
+            return queue.popleft()
+        return queue[0]
+    
+    def match(self, method, url):
+        url = url.split("#")[0]
+        for index, key in ((self.exact, (method, url)), (self.by_shape, (method, normalize_url(url))), (self.by_path, (method, strip_query(url)))):
+            queue = index.get(key)
+            if queue:
+                return HarReplayer.take(queue)
+        return None
+    
+    def delay_seconds(self, entry):
+        delay = self.latency_ms + random.uniform(0, self.jitter_ms)
+        if self.recorded_timing:
+            delay += max(0, entry.get('time', 0))
+        return delay / 1000
+    
+    def body(self, entry):
+        content = entry['response'].get('content', {})
+        text = content.get('text', "")
+        
+        if content.get('encoding') == "base64":
+            return base64.b64decode(text)
+        
+        if entry is self.message_entry:
+            text = text.replace(self.recorded_code, self.otp_code)
+        return text.encode("utf-8")
+    
+    async def handle(self, route):
+        request = route.request
+        entry = self.match(request.method, request.url)
+        
+        if entry is None:
+            ConsoleOutput.warn(Messages.WARN_HAR_UNMATCHED.format(name=self.name, method=request.method, url=request.url[:100]))
+            await route.abort()
+            return
+        
+        delay = self.delay_seconds(entry)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        
+        response = entry['response']
+        headers = {
+            header['name']: header['value']
+            for header in response.get('headers', [])
+            if header['name'].lower() not in SKIPPED_HEADERS and not header['name'].startswith(":")
+        }
+        
+        await route.fulfill(status=response['status'], headers=headers, body=self.body(entry))
+    
+    async def handle_web_socket(self, web_socket):
+        ConsoleOutput.warn(Messages.WARN_HAR_WEBSOCKET_BLOCKED.format(name=self.name, url=web_socket.url[:100]))
+        await web_socket.close(code=1008, reason="not recorded")
+
+def add_har_arguments(parser):
+    group = parser.add_argument_group("network record/replay")
+    mode = group.add_mutually_exclusive_group()
+    mode.add_argument("--record-har", nargs="?", const=ApplicationConfig.HAR_DIRECTORY, default=None, metavar="DIR", help="record app and inbox traffic to DIR/app.har and DIR/inbox.har")
+    mode.add_argument("--replay-har", nargs="?", const=ApplicationConfig.HAR_DIRECTORY, default=None, metavar="DIR", help="serve all traffic from previously recorded HAR files")
+    group.add_argument("--replay-latency", type=int, default=0, metavar="MS", help="fixed latency added to every replayed response")
+    group.add_argument("--replay-jitter", type=int, default=0, metavar="MS", help="random extra latency up to this many ms")
+    group.add_argument("--replay-recorded-timing", action="store_true", help="also delay each response by its recorded duration")
+    group.add_argument("--replay-otp", action="store_true", help="substitute a fresh OTP into replayed email bodies")
+
+def build_har_session(args):
+    if args.record_har:
+        return HarSession(HarSession.RECORD, args.record_har)
+    if args.replay_har:
+        session = HarSession(
+            HarSession.REPLAY, args.replay_har,
+            latency_ms=args.replay_latency,
+            jitter_ms=args.replay_jitter,
+            recorded_timing=args.replay_recorded_timing,
+            substitute_otp=args.replay_otp
+        )
+        for name in (ApplicationConfig.HAR_APP_NAME, ApplicationConfig.HAR_INBOX_NAME):
+            session.load(name)
+        return session
+    return None
+
+class HarSession:
+    RECORD = "record"
+    REPLAY = "replay"
+    
+    def __init__(self, mode, directory, latency_ms=0, jitter_ms=0, recorded_timing=False, substitute_otp=False):
+        self.mode = mode
+        self.directory = directory
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.recorded_timing = recorded_timing
+        self.substitute_otp = substitute_otp
+        self.entries = {}
+        
+        if mode == HarSession.RECORD:
+            os.makedirs(directory, exist_ok=True)
+    
+    def path(self, name):
+        return os.path.join(self.directory, f"{name}.har")
+    
+    def context_options(self, name):
+        if self.mode != HarSession.RECORD:
+            return {'service_workers': "block"}
+        
+        ConsoleOutput.info(f"{Messages.INFO_HAR_RECORDING} {self.path(name)}")
+        return {'record_har_path': self.path(name), 'record_har_content': "embed", 'service_workers': "block"}
+    
+    def load(self, name):
+        if name not in self.entries:
+            try:
+                with open(self.path(name), encoding="utf-8") as f:
+                    self.entries[name] = json.load(f)['log']['entries']
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                raise RuntimeError(Messages.ERROR_HAR_UNREADABLE.format(path=self.path(name), error=e)) from e
+            ConsoleOutput.info(Messages.INFO_HAR_LOADED.format(count=len(self.entries[name]), path=self.path(name)))
+        return self.entries[name]
+    
+    async def attach(self, context, name):
+        if self.mode != HarSession.REPLAY:
+            return None
+        
+        otp_code = None
+        if self.substitute_otp and name == ApplicationConfig.HAR_INBOX_NAME:
+            otp_code = f"{random.randint(0, 999999):06d}"
+        
+        replayer = HarReplayer(
+            self.load(name), name,
+            latency_ms=self.latency_ms,
+            jitter_ms=self.jitter_ms,
+            recorded_timing=self.recorded_timing,
+            otp_code=otp_code
+        )
+        if otp_code and replayer.message_entry is None:
+            ConsoleOutput.warn(Messages.WARN_HAR_NO_MESSAGE_BODY.format(path=self.path(name)))
+        elif otp_code:
+            ConsoleOutput.info(Messages.INFO_HAR_OTP_SUBSTITUTED.format(code=otp_code, recorded=replayer.recorded_code))
+        await context.route("**/*", replayer.handle)
+        await context.route_web_socket("**/*", replayer.handle_web_socket)
+        return replayer
@@ -0,0 +1,205 @@
+import time
+from config import Messages, Selectors
+from utils import ConsoleOutput
+
+SET_VALUES = """
+(entries) => {
+    const setters = [HTMLInputElement, HTMLTextAreaElement].map(
+        (cls) => Object.getOwnPropertyDescriptor(cls.prototype, "value").set
+    );
+    for (const [selector, value] of entries) {
+        for (const el of document.querySelectorAll(selector)) {
+            const setter = el instanceof HTMLTextAreaElement ? setters[1] : setters[0];
+            el.focus();
+            setter.call(el, value);
+            el.dispatchEvent(new Event("input", { bubbles: true }));
+            el.dispatchEvent(new Event("change", { bubbles: true }));
+            el.blur();
+        }
+    }
+}
+"""
+
+READ_VALUES = """
+async ([selectors, errorSelector]) => {
+    await new Promise((resolve) => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+    await new Promise((resolve) => setTimeout(resolve, 50));
+    return selectors.map((selector) => {
+        const el = document.querySelector(selector);
+        if (!el) return [null, true];
+        const container = el.closest("div") || el.parentElement;
+        const message = Array.from(container.querySelectorAll(errorSelector)).some((node) => node !== el && node.innerText.trim());
+        return [el.value, el.getAttribute("aria-invalid") === "true" || !el.validity.valid || message];
+    });
+}
+"""
+
+READ_JOINED_VALUE = """
+async (selector) => {
+    await new Promise((resolve) => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+    return Array.from(document.querySelectorAll(selector)).map((el) => el.value).join("");
+}
+"""
+
+CHECKBOX_STATE = """
+const checkboxState = (label, box) => {
+    if (!label) return "missing";
+    if (box) return box.getAttribute("aria-checked");
+    if (label.control) return String(label.control.checked);
+    return label.getAttribute("aria-checked");
+};
+const findLabel = (labels, item) => {
+    const wanted = item.toLowerCase();
+    return labels.find((el) => el.innerText.trim().toLowerCase().includes(wanted));
+};
+"""
+
+TOGGLE_CHECKBOXES = """
+async ([items, checkboxSelector]) => {
+""" + CHECKBOX_STATE + """
+    const labels = Array.from(document.querySelectorAll("label"));
+    const targets = items.map((item) => {
+        const label = findLabel(labels, item);
+        return [label, label ? label.parentElement.querySelector(checkboxSelector) : null];
+    });
+    
+    for (const [label, box] of targets) {
+        const state = checkboxState(label, box);
+        if (state !== "missing" && state !== "true") (box || label).click();
+    }
+    
+    await new Promise((resolve) => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+    return targets.map(([label, box]) => checkboxState(label, box));
+}
+"""
+
+READ_CHECKBOXES = """
+([items, checkboxSelector]) => {
+""" + CHECKBOX_STATE + """
+    const labels = Array.from(document.querySelectorAll("label"));
+    return items.map((item) => {
+        const label = findLabel(labels, item);
+        return checkboxState(label, label ? label.parentElement.querySelector(checkboxSelector) : null);
+    });
+}
+"""
+
+class InputStrategies:
+    TEXT_STRATEGIES = ["batch", "fill"]
+    OTP_STRATEGIES = ["fill", "paste", "keys"]
+    CHECKBOX_STRATEGIES = ["bulk", "click"]
+    
+    @staticmethod
+    def field_selector(name):
+        return f"input[name='{name}']"
+    
+    @staticmethod
+    async def run(registry, key, strategies, apply, verify, reset=None):
+        for strategy in registry.ranked(key, strategies):
+            started = time.monotonic()
+            await apply(strategy)
+            accepted = await verify()
+            if accepted is not None:
+                registry.record(key, strategy, accepted)
+            
+            if accepted is not False:
+                ConsoleOutput.info(Messages.INFO_INPUT_STRATEGY.format(key=key, strategy=strategy, ms=(time.monotonic() - started) * 1000))
+                return strategy
+            
+            ConsoleOutput.warn(Messages.WARN_INPUT_STRATEGY_REJECTED.format(key=key, strategy=strategy))
+            if reset is not None:
+                await reset()
+        
+        raise RuntimeError(Messages.ERROR_INPUT_REJECTED.format(key=key))
+    
+    @staticmethod
+    async def fill_fields(page, registry, fields):
+        selectors = [InputStrategies.field_selector(name) for name in fields]
+        expected = [str(value) for value in fields.values()]
+        
+        async def apply(strategy):
+            if strategy == "batch":
+                await page.evaluate(SET_VALUES, [[selector, value] for selector, value in zip(selectors, expected)])
+            else:
+                for selector, value in zip(selectors, expected):
+                    await page.fill(selector, value)
+        
+        async def verify():
+            states = await page.evaluate(READ_VALUES, [selectors, Selectors.ERROR_ALERT])
+            return [value for value, _ in states] == expected and not any(invalid for _, invalid in states)
+        
+        return await InputStrategies.run(registry, "input_text", InputStrategies.TEXT_STRATEGIES, apply, verify)
+    
+    @staticmethod
+    async def enter_otp(page, registry, code):
+        otp_field = page.locator(Selectors.OTP_INPUT)
+        
+        async def reset():
+            await page.evaluate(SET_VALUES, [[Selectors.OTP_INPUT, ""]])
+        
+        async def apply(strategy):
+            if strategy == "fill":
+                await otp_field.first.fill(code)
+                return
+            
+            await otp_field.first.click()
+            if strategy == "paste":
+                await page.keyboard.insert_text(code)
+            else:
+                await page.keyboard.type(code)
+        
+        async def verify():
+            return await page.evaluate(READ_JOINED_VALUE, Selectors.OTP_INPUT) == code
+        
+        await reset()
+        return await InputStrategies.run(registry, "input_otp", InputStrategies.OTP_STRATEGIES, apply, verify, reset)
+    
+    @staticmethod
+    async def click_boxes(page, selections, settled=()):
+        for item in selections:
+            if item in settled:
+                continue
+            
+            label = page.locator(f"label:has-text('{item}')").first
+            if await label.count() == 0:
+                continue
+            
+            checkbox = label.locator("..").locator(Selectors.CHECKBOX_BUTTON)
+            if await checkbox.count() == 0:
+                await label.click()
+            elif await checkbox.get_attribute("aria-checked") != "true":
+                await checkbox.click()
+    
+    @staticmethod
+    async def check_boxes(page, registry, selections):
+        args = [list(selections), Selectors.CHECKBOX_BUTTON]
+        states = {'values': await page.evaluate(READ_CHECKBOXES, args), 'toggled': False}
+        
+        async def apply(strategy):
+            if strategy == "bulk":
+                states['values'] = await page.evaluate(TOGGLE_CHECKBOXES, args)
+                states['toggled'] = True
+            else:
+                settled = [
+                    item for item, state in zip(selections, states['values'])
+                    if state in ("true", "missing") or (state is None and states['toggled'])
+                ]
+                await InputStrategies.click_boxes(page, selections, settled)
+                states['values'] = await page.evaluate(READ_CHECKBOXES, args)
+        
+        async def verify():
+            if "false" in states['values']:
+                return False
+            if all(state == "true" for state in states['values']):
+                return True
+            return None
+        
+        strategy = await InputStrategies.run(registry, "input_checkbox", InputStrategies.CHECKBOX_STRATEGIES, apply, verify)
+        
+        for item, state in zip(selections, states['values']):
+            if state == "missing":
+                ConsoleOutput.warn(Messages.WARN_CHECKBOX_NOT_FOUND.format(text=item))
+            else:
+                ConsoleOutput.success(f"    [x] {item}")
+        
+        return strategy
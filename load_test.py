@@ -0,0 +1,211 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from playwright.async_api import async_playwright
+from config import ApplicationConfig, Messages
+from utils import ConsoleOutput, SelectorRegistry
+from batch_runner import BatchRunner
+from har_replay import add_har_arguments, build_har_session
+
+def percentile(values, pct):
+    if not values:
+        return None
+    
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+def bot_version():
+    root = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=root, capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=root, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if dirty else commit
+
+def latency_summary(values):
+    return {
+        'p50': percentile(values, 50),
+        'p90': percentile(values, 90),
+        'p99': percentile(values, 99),
+        'max': max(values) if values else None,
+        'samples': len(values)
+    }
+
+class LoadTester:
+    def __init__(self, playwright, steps, runs_per_step=None, headless=ApplicationConfig.BATCH_HEADLESS, har=None):
+        self.playwright = playwright
+        self.har = har
+        self.steps = steps
+        self.runs_per_step = runs_per_step
+        self.headless = headless
+        self.registry = SelectorRegistry()
+        self.step_reports = []
+    
+    async def run_step(self, concurrency, first_index):
+        sep = "=" * ApplicationConfig.SEPARATOR_LENGTH
+        print(f"\n{sep}\n  {Messages.HEADER_LOAD_STEP.format(concurrency=concurrency)}\n{sep}")
+        
+        runs = self.runs_per_step or concurrency * 2
+        runner = BatchRunner(self.playwright, runs, concurrency, headless=self.headless, first_index=first_index, registry=self.registry, har=self.har)
+        
+        started = time.monotonic()
+        results = await runner.run()
+        wall_seconds = time.monotonic() - started
+        
+        succeeded = [result for result in results if result['ok']]
+        phase_samples = {}
+        failures = {}
+        
+        for result in results:
+            for phase, seconds in result['phases'].items():
+                if result['ok'] or phase != result['failed_phase']:
+                    phase_samples.setdefault(phase, []).append(seconds)
+            if not result['ok']:
+                phase = result['failed_phase'] or "setup"
+                failures[phase] = failures.get(phase, 0) + 1
+        
+        report = {
+            'concurrency': concurrency,
+            'runs': len(results),
+            'succeeded': len(succeeded),
+            'failed': len(results) - len(succeeded),
+            'error_rate': (len(results) - len(succeeded)) / len(results) if results else 0.0,
+            'wall_seconds': wall_seconds,
+            'throughput_per_min': len(succeeded) / wall_seconds * 60 if wall_seconds else 0.0,
+            'run_latency': latency_summary([result['seconds'] for result in succeeded]),
+            'phase_latency': {phase: latency_summary(values) for phase, values in phase_samples.items()},
+            'failures_by_phase': failures,
+            'peak_memory_mb': runner.monitor.peak['total'] if runner.monitor.peak else None
+        }
+        
+        ConsoleOutput.info(Messages.INFO_LOAD_STEP_RESULT.format(
+            runs=report['runs'],
+            seconds=wall_seconds,
+            throughput=report['throughput_per_min'],
+            error_rate=report['error_rate']
+        ))
+        return report
+    
+    @staticmethod
+    def find_knee(step_reports):
+        for previous, current in zip(step_reports, step_reports[1:]):
+            if current['error_rate'] > ApplicationConfig.KNEE_ERROR_RATE:
+                return {
+                    'concurrency': previous['concurrency'],
+                    'reason': f"error rate {current['error_rate']:.0%} at concurrency {current['concurrency']}"
+                }
+            
+            if previous['throughput_per_min'] <= 0:
+                continue
+            
+            gain = current['throughput_per_min'] / previous['throughput_per_min'] - 1
+            if gain < ApplicationConfig.KNEE_GAIN_THRESHOLD:
+                return {
+                    'concurrency': previous['concurrency'],
+                    'reason': f"throughput gain {gain:+.0%} from {previous['concurrency']} to {current['concurrency']}"
+                }
+        
+        return None
+    
+    async def run(self):
+        first_index = 1
+        
+        for concurrency in self.steps:
+            report = await self.run_step(concurrency, first_index)
+            self.step_reports.append(report)
+            first_index += report['runs']
+        
+        self.registry.save()
+        
+        return {
+            'bot_version': bot_version(),
+            'target_url': ApplicationConfig.TARGET_URL,
+            'inbox_url': ApplicationConfig.MAILINATOR_INBOX_URL,
+            'har_replay': self.har.directory if self.har else None,
+            'started_at': ApplicationConfig.TIMESTAMP,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'steps': self.step_reports,
+            'knee': LoadTester.find_knee(self.step_reports)
+        }
+    
+    @staticmethod
+    def print_summary(report):
+        sep = "=" * ApplicationConfig.SEPARATOR_LENGTH
+        print(f"\n{sep}\n  {Messages.HEADER_LOAD_SUMMARY}\n{sep}")
+        print(f"  {'conc':>5} {'runs':>5} {'runs/min':>9} {'errors':>7} {'p50 s':>8} {'p90 s':>8}")
+        
+        for step in report['steps']:
+            latency = step['run_latency']
+            p50 = f"{latency['p50']:.1f}" if latency['p50'] is not None else "-"
+            p90 = f"{latency['p90']:.1f}" if latency['p90'] is not None else "-"
+            print(f"  {step['concurrency']:>5} {step['runs']:>5} {step['throughput_per_min']:>9.2f} {step['error_rate']:>7.0%} {p50:>8} {p90:>8}")
+        
+        knee = report['knee']
+        if knee:
+            ConsoleOutput.info(Messages.INFO_KNEE_FOUND.format(concurrency=knee['concurrency'], reason=knee['reason']))
+        elif report['steps']:
+            ConsoleOutput.info(Messages.INFO_KNEE_NOT_REACHED.format(concurrency=report['steps'][-1]['concurrency']))
+
+async def execute_load_test(args, har=None):
+    ConsoleOutput.configure()
+    
+    async with async_playwright() as pw:
+        tester = LoadTester(pw, args.steps, args.runs_per_step, headless=not args.headed, har=har)
+        report = await tester.run()
+    
+    LoadTester.print_summary(report)
+    
+    with open(args.report, "w") as f:
+        json.dump(report, f, indent=2)
+    ConsoleOutput.info(f"{Messages.INFO_REPORT_WRITTEN} {args.report}")
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Ramp SignupBot concurrency and report saturation")
+    parser.add_argument("--target", default=None, help="registration site to load, e.g. a local stand-in (required unless --replay-har is given)")
+    parser.add_argument("--inbox-url", default=None, help="inbox URL prefix the username is appended to (required with --target)")
+    parser.add_argument("--steps", type=lambda value: [int(step) for step in value.split(",")], default=ApplicationConfig.LOAD_TEST_STEPS, help="comma-separated concurrency levels, e.g. 1,2,4,8")
+    parser.add_argument("--runs-per-step", type=int, default=None, help="runs per step (default: 2 x concurrency)")
+    parser.add_argument("--memory-budget", type=int, default=ApplicationConfig.MEMORY_BUDGET_MB, help="per-node RSS budget in MB")
+    parser.add_argument("--report", default=ApplicationConfig.LOAD_TEST_REPORT_FILE, help="where to write the JSON report")
+    parser.add_argument("--headed", action="store_true", help="show the browser windows")
+    add_har_arguments(parser)
+    
+    args = parser.parse_args()
+    if args.record_har:
+        parser.error("--record-har is not supported in load tests; record with main.py")
+    if not args.replay_har and not (args.target and args.inbox_url):
+        parser.error("pass --target and --inbox-url for a stand-in site, or --replay-har to replay a recording")
+    return args
+
+def main():
+    args = parse_arguments()
+    if args.target:
+        ApplicationConfig.TARGET_URL = args.target
+    if args.inbox_url:
+        ApplicationConfig.MAILINATOR_INBOX_URL = args.inbox_url
+    ApplicationConfig.MEMORY_BUDGET_MB = args.memory_budget
+    
+    try:
+        har = build_har_session(args)
+    except RuntimeError as error:
+        print(f"\n!!! ERROR !!!\n{error}")
+        sys.exit(1)
+    
+    try:
+        asyncio.run(execute_load_test(args, har))
+    except KeyboardInterrupt:
+        print("\n\nLoad test interrupted by user.")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
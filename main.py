@@ -1,3 +1,4 @@
+import argparse
 import asyncio
 import traceback
 import sys
@@ -6,6 +7,9 @@ from playwright.async_api import async_playwright
 from config import ApplicationConfig, Messages
 from utils import ConsoleOutput, ProfileBuilder
 from signup_bot import SignupBot
+from batch_runner import BatchRunner
+from metrics import MetricsServer
+from har_replay import add_har_arguments, build_har_session
 
 def display_startup_banner(profile):
     sep = "=" * 64
@@ -17,20 +21,72 @@ def display_startup_banner(profile):
     print(f"  Agency    : {profile['company_info']['name']}")
     print(f"  Password  : {profile['user_info']['credential']}")
 
-async def execute_automation():
+async def start_metrics_server(port):
+    if port is None:
+        return None
+    
+    server = MetricsServer(port)
+    await server.start()
+    ConsoleOutput.info(Messages.INFO_METRICS_SERVING.format(host=server.host, port=server.port))
+    return server
+
+async def stop_metrics_server(server):
+    if server is not None:
+        await server.close()
+
+async def execute_automation(metrics_port=None, har=None):
     ConsoleOutput.configure()
     profile = ProfileBuilder.build()
     display_startup_banner(profile)
+    server = await start_metrics_server(metrics_port)
     
-    async with async_playwright() as pw:
-        bot = SignupBot(profile)
-        await bot.setup_browser(pw)
-        await bot.run_workflow()
-        ConsoleOutput.final_footer()
+    try:
+        async with async_playwright() as pw:
+            bot = SignupBot(profile, har=har)
+            await bot.setup_browser(pw)
+            await bot.run_workflow()
+            ConsoleOutput.stats_table(bot.selectors.report())
+            ConsoleOutput.final_footer()
+    finally:
+        await stop_metrics_server(server)
+
+async def execute_batch(runs, concurrency, metrics_port=None, har=None):
+    ConsoleOutput.configure()
+    server = await start_metrics_server(metrics_port)
+    
+    try:
+        async with async_playwright() as pw:
+            runner = BatchRunner(pw, runs, concurrency, har=har)
+            await runner.run()
+            runner.print_summary()
+            ConsoleOutput.stats_table(runner.registry.report())
+            ConsoleOutput.final_footer()
+    finally:
+        await stop_metrics_server(server)
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Automated partner signup")
+    parser.add_argument("--runs", type=int, default=1, help="number of signups to perform")
+    parser.add_argument("--concurrency", type=int, default=ApplicationConfig.BATCH_CONCURRENCY, help="maximum parallel runs in batch mode")
+    parser.add_argument("--memory-budget", type=int, default=ApplicationConfig.MEMORY_BUDGET_MB, help="per-node RSS budget in MB for admitting new runs")
+    parser.add_argument("--metrics-port", type=int, nargs="?", const=ApplicationConfig.METRICS_PORT, default=None, help="serve Prometheus metrics on this port (default port if no value given)")
+    add_har_arguments(parser)
+    
+    args = parser.parse_args()
+    if args.record_har and args.runs > 1:
+        parser.error("--record-har records a single run; drop --runs")
+    return args
 
 def main():
+    args = parse_arguments()
+    ApplicationConfig.MEMORY_BUDGET_MB = args.memory_budget
+    
     try:
-        asyncio.run(execute_automation())
+        har = build_har_session(args)
+        if args.runs > 1:
+            asyncio.run(execute_batch(args.runs, args.concurrency, args.metrics_port, har))
+        else:
+            asyncio.run(execute_automation(args.metrics_port, har))
         print("\nScript execution completed. Exiting in 5 seconds...")
         time.sleep(5)
         sys.exit(0)
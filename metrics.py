@@ -0,0 +1,179 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from config import ApplicationConfig
+
+LATENCY_BUCKETS = (0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+OTP_DELIVERY_BUCKETS = (2.5, 5, 10, 15, 20, 30, 45, 60, 90, 120)
+ATTEMPT_BUCKETS = tuple(range(1, ApplicationConfig.MAX_VERIFICATION_ATTEMPTS + 1))
+
+def format_labels(names, values, extra=None):
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    
+    escaped = [
+        f'{name}="' + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for name, value in pairs
+    ]
+    return "{" + ",".join(escaped) + "}"
+
+def format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+class Metric:
+    kind = "untyped"
+    
+    def __init__(self, name, description, labels=()):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(labels)
+        self.values = {}
+    
+    def key(self, labels):
+        return tuple(labels.get(name, "") for name in self.label_names)
+    
+    def header(self):
+        return [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.kind}"]
+    
+    def render(self):
+        lines = self.header()
+        for key, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{format_labels(self.label_names, key)} {format_value(value)}")
+        return lines
+
+class Counter(Metric):
+    kind = "counter"
+    
+    def inc(self, amount=1, **labels):
+        key = self.key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+class Gauge(Metric):
+    kind = "gauge"
+    
+    def set(self, value, **labels):
+        self.values[self.key(labels)] = value
+    
+    def inc(self, amount=1, **labels):
+        key = self.key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+    
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+class Histogram(Metric):
+    kind = "histogram"
+    
+    def __init__(self, name, description, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, description, labels)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+    
+    def observe(self, value, **labels):
+        key = self.key(labels)
+        series = self.values.setdefault(key, {'counts': [0] * len(self.buckets), 'sum': 0.0, 'count': 0})
+        
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series['counts'][i] += 1
+        series['sum'] += value
+        series['count'] += 1
+    
+    def render(self):
+        lines = self.header()
+        for key, series in sorted(self.values.items()):
+            for bound, count in zip(self.buckets, series['counts']):
+                labels = format_labels(self.label_names, key, ("le", format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {count}")
+            labels = format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {format_value(series['sum'])}")
+            lines.append(f"{self.name}_count{labels} {series['count']}")
+        return lines
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics = []
+    
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+    
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+REGISTRY = MetricsRegistry()
+
+PHASE_STARTED = REGISTRY.register(Counter("signup_phase_started_total", "Workflow phases started.", ["phase"]))
+PHASE_SUCCEEDED = REGISTRY.register(Counter("signup_phase_succeeded_total", "Workflow phases completed without error.", ["phase"]))
+PHASE_FAILED = REGISTRY.register(Counter("signup_phase_failed_total", "Workflow phases that raised.", ["phase"]))
+PHASE_SECONDS = REGISTRY.register(Histogram("signup_phase_duration_seconds", "Wall time spent in each workflow phase.", ["phase"], LATENCY_BUCKETS))
+OTP_DELIVERY_SECONDS = REGISTRY.register(Histogram("signup_otp_delivery_seconds", "Time from requesting an OTP to reading it from the inbox.", (), OTP_DELIVERY_BUCKETS))
+VERIFICATION_ATTEMPTS = REGISTRY.register(Histogram("signup_verification_attempts", "OTP attempts made per verification, by result.", ["result"], ATTEMPT_BUCKETS))
+TRANSITION_SECONDS = REGISTRY.register(Histogram("signup_transition_seconds", "Time from a submit click until the page answered.", ["outcome"], LATENCY_BUCKETS))
+ACTIVE_CONTEXTS = REGISTRY.register(Gauge("signup_active_browser_contexts", "Browser contexts currently open."))
+QUEUED_JOBS = REGISTRY.register(Gauge("signup_queued_jobs", "Batch runs waiting for admission."))
+
+@asynccontextmanager
+async def track_phase(phase):
+    PHASE_STARTED.inc(phase=phase)
+    started = time.monotonic()
+    try:
+        yield
+    except BaseException:
+        PHASE_FAILED.inc(phase=phase)
+        raise
+    else:
+        PHASE_SUCCEEDED.inc(phase=phase)
+    finally:
+        PHASE_SECONDS.observe(time.monotonic() - started, phase=phase)
+
+class MetricsServer:
+    def __init__(self, port=ApplicationConfig.METRICS_PORT, host=ApplicationConfig.METRICS_HOST, registry=REGISTRY):
+        self.host = host
+        self.port = port
+        self.registry = registry
+        self.server = None
+    
+    async def handle(self, reader, writer):
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            while (await asyncio.wait_for(reader.readline(), timeout=5)) not in (b"\r\n", b"\n", b""):
+                pass
+            
+            parts = request_line.decode("latin-1").split()
+            path = parts[1].split("?")[0] if len(parts) > 1 else ""
+            
+            if path == "/metrics":
+                status, body = "200 OK", self.registry.render()
+            else:
+                status, body = "404 Not Found", "not found\n"
+            
+            payload = body.encode("utf-8")
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: close\r\n\r\n".encode("latin-1") + payload
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+    
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, self.host, self.port)
+    
+    async def close(self):
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
@@ -0,0 +1,191 @@
+import asyncio
+import psutil
+from config import ApplicationConfig, Messages
+from utils import ConsoleOutput
+from signup_bot import SignupBot
+
+BYTES_PER_MB = 1024 * 1024
+
+class MemoryMonitor:
+    def __init__(self, budget_mb=None, interval=None):
+        self.budget_mb = budget_mb or ApplicationConfig.MEMORY_BUDGET_MB
+        self.interval = interval or ApplicationConfig.MEMORY_SAMPLE_INTERVAL
+        self.root = psutil.Process()
+        self.latest = None
+        self.peak = None
+        self.admitted_since_sample = 0
+    
+    @staticmethod
+    def classify(proc):
+        try:
+            name = proc.name().lower()
+            cmdline = " ".join(proc.cmdline())
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+        
+        if "--type=renderer" in cmdline:
+            return "renderer"
+        if "--type=" in cmdline:
+            return "helper"
+        if "chrom" in name or "headless_shell" in name:
+            return "browser"
+        if "node" in name or "playwright" in cmdline:
+            return "driver"
+        return None
+    
+    @staticmethod
+    def rss_mb(proc):
+        try:
+            return proc.memory_info().rss / BYTES_PER_MB
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return 0.0
+    
+    def browser_pids(self):
+        return {proc.pid for proc in self.root.children(recursive=True) if MemoryMonitor.classify(proc) == "browser"}
+    
+    def tree_mb(self, pid):
+        try:
+            proc = psutil.Process(pid)
+            return MemoryMonitor.rss_mb(proc) + sum(MemoryMonitor.rss_mb(child) for child in proc.children(recursive=True))
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return 0.0
+    
+    def sample(self):
+        snapshot = {
+            'runner': MemoryMonitor.rss_mb(self.root),
+            'driver': 0.0,
+            'browser': 0.0,
+            'helper': 0.0,
+            'renderers': {}
+        }
+        
+        for proc in self.root.children(recursive=True):
+            kind = MemoryMonitor.classify(proc)
+            if kind == "renderer":
+                snapshot['renderers'][proc.pid] = MemoryMonitor.rss_mb(proc)
+            elif kind:
+                snapshot[kind] += MemoryMonitor.rss_mb(proc)
+        
+        snapshot['total'] = (
+            snapshot['runner'] + snapshot['driver'] + snapshot['browser']
+            + snapshot['helper'] + sum(snapshot['renderers'].values())
+        )
+        
+        self.latest = snapshot
+        if self.peak is None or snapshot['total'] > self.peak['total']:
+            self.peak = snapshot
+        
+        return snapshot
+    
+    def run_estimate_mb(self, sampled_runs):
+        if self.latest is None or sampled_runs <= 0:
+            return ApplicationConfig.RUN_MEMORY_ESTIMATE_MB
+        
+        per_run = (self.latest['helper'] + sum(self.latest['renderers'].values())) / sampled_runs
+        return max(ApplicationConfig.RUN_MEMORY_ESTIMATE_MB, per_run)
+    
+    def projected_mb(self, active_runs):
+        sampled_runs = active_runs - self.admitted_since_sample
+        return self.latest['total'] + (self.admitted_since_sample + 1) * self.run_estimate_mb(sampled_runs)
+    
+    def can_admit(self, active_runs):
+        if active_runs == 0:
+            return True
+        if self.latest is None:
+            return False
+        
+        return self.projected_mb(active_runs) <= self.budget_mb
+    
+    def note_admission(self):
+        self.admitted_since_sample += 1
+    
+    async def run(self, on_sample=None):
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                admitted_before = self.admitted_since_sample
+                snapshot = await loop.run_in_executor(None, self.sample)
+                self.admitted_since_sample -= admitted_before
+                if on_sample is not None:
+                    await on_sample(self, snapshot)
+            except Exception as e:
+                ConsoleOutput.warn(f"{Messages.WARN_MONITOR_FAILED} {str(e)[:100]}")
+            await asyncio.sleep(self.interval)
+    
+    def peak_summary(self):
+        if self.peak is None:
+            return None
+        
+        return Messages.INFO_PEAK_MEMORY.format(
+            total=self.peak['total'],
+            driver=self.peak['driver'],
+            browser=self.peak['browser'] + self.peak['helper'],
+            renderers=sum(self.peak['renderers'].values()),
+            count=len(self.peak['renderers'])
+        )
+
+class BrowserPool:
+    def __init__(self, playwright, monitor, headless=ApplicationConfig.BATCH_HEADLESS):
+        self.playwright = playwright
+        self.monitor = monitor
+        self.headless = headless
+        self.current = None
+        self.leases = {}
+        self.pids = {}
+        self.baselines = {}
+        self.lock = asyncio.Lock()
+    
+    async def launch(self):
+        before = self.monitor.browser_pids()
+        browser = await SignupBot.launch_browser(self.playwright, headless=self.headless)
+        new_pids = self.monitor.browser_pids() - before
+        
+        self.pids[browser] = min(new_pids) if new_pids else None
+        self.baselines[browser] = self.monitor.tree_mb(self.pids[browser]) if self.pids[browser] else 0.0
+        self.leases[browser] = 0
+        ConsoleOutput.info(Messages.INFO_BROWSER_LAUNCHED.format(pid=self.pids[browser]))
+        return browser
+    
+    async def acquire(self):
+        async with self.lock:
+            if self.current is None:
+                self.current = await self.launch()
+            self.leases[self.current] += 1
+            return self.current
+    
+    async def release(self, browser):
+        self.leases[browser] -= 1
+        if browser is not self.current and self.leases[browser] == 0:
+            await self.close(browser)
+    
+    async def close(self, browser):
+        pid = self.pids.pop(browser, None)
+        self.leases.pop(browser, None)
+        self.baselines.pop(browser, None)
+        await browser.close()
+        ConsoleOutput.info(Messages.INFO_BROWSER_CLOSED.format(pid=pid))
+    
+    async def recycle_if_leaking(self, monitor, snapshot):
+        browser = self.current
+        pid = self.pids.get(browser)
+        if browser is None or pid is None:
+            return
+        
+        rss = monitor.tree_mb(pid)
+        expected = self.baselines.get(browser, 0.0) + self.leases.get(browser, 0) * ApplicationConfig.RUN_MEMORY_ESTIMATE_MB
+        excess = rss - expected
+        if excess <= ApplicationConfig.BROWSER_RECYCLE_MB:
+            return
+        
+        ConsoleOutput.warn(Messages.WARN_BROWSER_RECYCLE.format(pid=pid, rss=rss, excess=excess, limit=ApplicationConfig.BROWSER_RECYCLE_MB))
+        async with self.lock:
+            if self.current is browser:
+                self.current = None
+        
+        if self.leases.get(browser) == 0:
+            await self.close(browser)
+    
+    async def close_all(self):
+        for browser in list(self.leases):
+            await self.close(browser)
+        self.current = None
@@ -1,28 +1,99 @@
 import random
+import time
 from config import ApplicationConfig, FieldNames, Selectors, Messages, DataPools, Patterns
-from utils import ConsoleOutput, DelayController, ElementFinder, FormInteractor, EmailReader, FileManager
+from utils import ConsoleOutput, DelayController, ElementFinder, FormInteractor, EmailReader, FileManager, SelectorRegistry, NavigationCache
+from metrics import ACTIVE_CONTEXTS, VERIFICATION_ATTEMPTS, track_phase
+from transitions import TransitionDetector, TransitionOutcome
+from input_strategies import InputStrategies
 
 class SignupBot:
-    def __init__(self, profile):
+    def __init__(self, profile, registry=None, har=None, navigation=None):
         self.profile = profile
+        self.selectors = registry or SelectorRegistry()
+        self.navigation = navigation or NavigationCache()
+        self.har = har
         self.browser = None
+        self.owns_browser = False
         self.context = None
         self.page = None
+        self.inbox_context = None
+        self.inbox_page = None
+        self.otp_requested_at = None
+        self.phase_timings = {}
+        self.failed_phase = None
     
-    async def setup_browser(self, playwright):
-        self.browser = await playwright.chromium.launch(headless=False, slow_mo=ApplicationConfig.SLOW_MOTION_MS)
-        self.context = await self.browser.new_context(viewport={"width": ApplicationConfig.BROWSER_WIDTH, "height": ApplicationConfig.BROWSER_HEIGHT})
+    @staticmethod
+    async def launch_browser(playwright, headless=False):
+        slow_mo = 0 if headless else ApplicationConfig.SLOW_MOTION_MS
+        return await playwright.chromium.launch(headless=headless, slow_mo=slow_mo)
+    
+    async def setup_browser(self, playwright, browser=None):
+        self.owns_browser = browser is None
+        self.browser = browser or await SignupBot.launch_browser(playwright)
+        self.context = await self.new_context(ApplicationConfig.HAR_APP_NAME, viewport={"width": ApplicationConfig.BROWSER_WIDTH, "height": ApplicationConfig.BROWSER_HEIGHT})
         self.page = await self.context.new_page()
     
+    async def new_context(self, name, **options):
+        if self.har:
+            options.update(self.har.context_options(name))
+        
+        context = await self.browser.new_context(**options)
+        ACTIVE_CONTEXTS.inc()
+        
+        if self.har:
+            try:
+                await self.har.attach(context, name)
+            except Exception:
+                await context.close()
+                ACTIVE_CONTEXTS.dec()
+                raise
+        return context
+    
+    async def open_inbox(self):
+        if self.inbox_page is None:
+            self.inbox_context = await self.new_context(ApplicationConfig.HAR_INBOX_NAME)
+            self.inbox_page = await self.inbox_context.new_page()
+        return self.inbox_page
+    
     async def teardown(self):
+        if self.inbox_context:
+            await self.inbox_context.close()
+            ACTIVE_CONTEXTS.dec()
         if self.context:
             await self.context.close()
-        if self.browser:
+            ACTIVE_CONTEXTS.dec()
+        if self.browser and self.owns_browser:
             await self.browser.close()
     
-    async def phase_0_accept_terms(self):
-        ConsoleOutput.section(0, Messages.HEADER_TERMS)
+    async def fill_fields(self, fields):
+        await InputStrategies.fill_fields(self.page, self.selectors, fields)
+        for name, value in fields.items():
+            ConsoleOutput.success(f"{name} = {value}")
+    
+    async def submit_step(self, step, button, marker=None, expect_url_change=False):
+        result = await TransitionDetector.submit(self.page, button, marker, expect_url_change)
+        ConsoleOutput.info(Messages.INFO_TRANSITION.format(outcome=result.outcome, elapsed=result.elapsed))
+        
+        if result.outcome == TransitionOutcome.ERROR:
+            raise RuntimeError(Messages.ERROR_STEP_REJECTED.format(step=step, detail=result.detail))
+        if result.outcome == TransitionOutcome.TIMEOUT:
+            raise RuntimeError(Messages.ERROR_STEP_TIMEOUT.format(step=step, seconds=result.elapsed))
         
+        return result
+    
+    async def open_cached_registration(self, entry):
+        ConsoleOutput.info(f"{Messages.INFO_CACHED_NAVIGATION} {entry['registration_url']} …")
+        
+        try:
+            await self.page.goto(entry['registration_url'], wait_until="domcontentloaded", timeout=ApplicationConfig.CACHED_NAVIGATION_TIMEOUT_MS)
+            await self.page.locator(Selectors.CHECKBOX_BUTTON).first.wait_for(state="visible", timeout=ApplicationConfig.CACHED_NAVIGATION_TIMEOUT_MS)
+            return True
+        except Exception as e:
+            ConsoleOutput.warn(f"{Messages.WARN_STALE_NAVIGATION} {str(e)[:100]}")
+            self.navigation.invalidate(ApplicationConfig.TARGET_URL)
+            return False
+    
+    async def discover_registration(self):
         ConsoleOutput.info(f"{Messages.INFO_NAVIGATING} {ApplicationConfig.TARGET_URL} …")
         await self.page.goto(ApplicationConfig.TARGET_URL, wait_until="networkidle", timeout=30000)
         await DelayController.natural_wait(self.page, 2000)
@@ -46,97 +117,102 @@ class SignupBot:
         await DelayController.natural_wait(self.page, 1000)
         await reg_link.click()
         ConsoleOutput.success(f"{Messages.SUCCESS_CLICKED} registration link")
-        await DelayController.natural_wait(self.page, 3000)
+        
+        await self.page.locator(Selectors.CHECKBOX_BUTTON).first.wait_for(state="visible", timeout=30000)
+        
+        if not self.har:
+            self.navigation.store(ApplicationConfig.TARGET_URL, self.page.url)
+            ConsoleOutput.info(f"{Messages.INFO_NAVIGATION_CACHED} {self.page.url}")
+    
+    async def phase_0_accept_terms(self):
+        ConsoleOutput.section(0, Messages.HEADER_TERMS)
+        
+        entry = None if self.har else self.navigation.get(ApplicationConfig.TARGET_URL)
+        if not (entry and await self.open_cached_registration(entry)):
+            await self.discover_registration()
         
         await self.page.locator(Selectors.CHECKBOX_BUTTON).click()
         ConsoleOutput.success(Messages.SUCCESS_AGREED)
         
-        await self.page.locator(Selectors.CONTINUE_BUTTON).click()
+        await self.submit_step(Messages.HEADER_TERMS, self.page.locator(Selectors.CONTINUE_BUTTON), f"input[name='{FieldNames.FIRST_NAME}']")
         ConsoleOutput.success(Messages.SUCCESS_CONTINUE)
-        await DelayController.natural_wait(self.page, 2000)
     
     async def phase_1_create_account(self):
         ConsoleOutput.section(1, Messages.HEADER_ACCOUNT)
         
         user = self.profile['user_info']
         
-        await self.page.fill(f"input[name='{FieldNames.FIRST_NAME}']", user['given_name'])
-        ConsoleOutput.success(f"{FieldNames.FIRST_NAME} = {user['given_name']}")
-        
-        await self.page.fill(f"input[name='{FieldNames.LAST_NAME}']", user['family_name'])
-        ConsoleOutput.success(f"{FieldNames.LAST_NAME} = {user['family_name']}")
-        
-        email = f"{user['email_user']}@{ApplicationConfig.EMAIL_DOMAIN}"
-        await self.page.fill(f"input[name='{FieldNames.EMAIL}']", email)
-        ConsoleOutput.success(f"{FieldNames.EMAIL} = {email}")
-        
-        await self.page.fill(f"input[name='{FieldNames.PHONE_NUMBER}']", user['phone'])
-        ConsoleOutput.success(f"{FieldNames.PHONE_NUMBER} = {user['phone']}")
-        
-        await self.page.fill(f"input[name='{FieldNames.PASSWORD}']", user['credential'])
-        ConsoleOutput.success(f"{FieldNames.PASSWORD} = {user['credential']}")
-        
-        await self.page.fill(f"input[name='{FieldNames.CONFIRM_PASSWORD}']", user['credential'])
-        ConsoleOutput.success(f"{FieldNames.CONFIRM_PASSWORD} = {user['credential']}")
-        
-        await self.page.locator(Selectors.SUBMIT_BUTTON).click()
+        await self.fill_fields({
+            FieldNames.FIRST_NAME: user['given_name'],
+            FieldNames.LAST_NAME: user['family_name'],
+            FieldNames.EMAIL: f"{user['email_user']}@{ApplicationConfig.EMAIL_DOMAIN}",
+            FieldNames.PHONE_NUMBER: user['phone'],
+            FieldNames.PASSWORD: user['credential'],
+            FieldNames.CONFIRM_PASSWORD: user['credential']
+        })
+        
+        self.otp_requested_at = time.monotonic()
+        await self.submit_step(Messages.HEADER_ACCOUNT, self.page.locator(Selectors.SUBMIT_BUTTON), Selectors.OTP_INPUT)
         ConsoleOutput.success(Messages.SUCCESS_SUBMITTED)
-        await DelayController.natural_wait(self.page, 3000)
-        
-        otp_field = self.page.locator(Selectors.OTP_INPUT)
-        await otp_field.wait_for(state="visible", timeout=30000)
         ConsoleOutput.success(Messages.SUCCESS_OTP_APPEARED)
     
     async def phase_1b_verify_otp(self):
         ConsoleOutput.section("1b", Messages.HEADER_OTP)
         
         verified = False
+        attempts = 0
+        outcome = "failed"
         
-        for attempt in range(1, ApplicationConfig.MAX_VERIFICATION_ATTEMPTS + 1):
-            ConsoleOutput.info(f"OTP attempt {attempt}")
-            ConsoleOutput.info(Messages.INFO_WAITING_EMAIL)
-            await DelayController.natural_wait(self.page, 5000)
-            
-            code = await EmailReader.fetch_otp(self.browser, self.profile['user_info']['email_user'])
-            
-            otp_field = self.page.locator(Selectors.OTP_INPUT)
-            await otp_field.first.wait_for(state="visible", timeout=10000)
-            
-            await otp_field.first.click()
-            await DelayController.natural_wait(self.page, 300)
-            
-            for digit in code:
-                await self.page.keyboard.press(digit)
-                await DelayController.natural_wait(self.page, 150)
-            
-            ConsoleOutput.success(f"{Messages.SUCCESS_OTP_TYPED}: {code}")
-            
-            await self.page.locator(Selectors.SUBMIT_BUTTON).click()
-            ConsoleOutput.success(Messages.SUCCESS_VERIFICATION_SUBMITTED)
-            await DelayController.natural_wait(self.page, 4000)
-            
-            error_elem = self.page.locator(Selectors.ERROR_ALERT)
-            if await error_elem.count() > 0:
-                try:
-                    error = await error_elem.first.inner_text(timeout=2000)
-                    ConsoleOutput.warn(f"{Messages.WARN_ERROR_DETECTED} {error}")
+        try:
+            for attempt in range(1, ApplicationConfig.MAX_VERIFICATION_ATTEMPTS + 1):
+                attempts = attempt
+                ConsoleOutput.info(f"OTP attempt {attempt}")
+                ConsoleOutput.info(Messages.INFO_WAITING_EMAIL)
+                await DelayController.natural_wait(self.page, 5000)
+                
+                inbox = await self.open_inbox()
+                code = await EmailReader.fetch_otp(inbox, self.profile['user_info']['email_user'], self.otp_requested_at)
+                
+                otp_field = self.page.locator(Selectors.OTP_INPUT)
+                await otp_field.first.wait_for(state="visible", timeout=10000)
+                await InputStrategies.enter_otp(self.page, self.selectors, code)
+                ConsoleOutput.success(f"{Messages.SUCCESS_OTP_TYPED}: {code}")
+                
+                result = await TransitionDetector.submit(
+                    self.page,
+                    self.page.locator(Selectors.SUBMIT_BUTTON),
+                    f"input[name='{FieldNames.AGENCY_NAME}']"
+                )
+                ConsoleOutput.success(Messages.SUCCESS_VERIFICATION_SUBMITTED)
+                ConsoleOutput.info(Messages.INFO_TRANSITION.format(outcome=result.outcome, elapsed=result.elapsed))
+                
+                if result.outcome == TransitionOutcome.TIMEOUT:
+                    raise RuntimeError(Messages.ERROR_STEP_TIMEOUT.format(step=Messages.HEADER_OTP, seconds=result.elapsed))
+                
+                if result.outcome == TransitionOutcome.ERROR:
+                    ConsoleOutput.warn(f"{Messages.WARN_ERROR_DETECTED} {result.detail}")
+                    
+                    if not any(kw in result.detail.lower() for kw in Patterns.ERROR_KEYWORDS):
+                        raise RuntimeError(Messages.ERROR_STEP_REJECTED.format(step=Messages.HEADER_OTP, detail=result.detail))
+                    if attempt == ApplicationConfig.MAX_VERIFICATION_ATTEMPTS:
+                        outcome = "exhausted"
+                        raise RuntimeError(Messages.ERROR_VERIFICATION_FAILED)
                     
-                    if "expired" in error.lower() or "invalid" in error.lower():
-                        if attempt < ApplicationConfig.MAX_VERIFICATION_ATTEMPTS:
-                            ConsoleOutput.info(Messages.WARN_OTP_INVALID)
-                            resend = self.page.locator(Selectors.RESEND_BUTTON)
-                            if await resend.count() > 0:
-                                await resend.first.click()
-                                ConsoleOutput.success(Messages.SUCCESS_RESEND_CLICKED)
-                                await DelayController.natural_wait(self.page, 3000)
-                            continue
-                        else:
-                            raise RuntimeError(Messages.ERROR_VERIFICATION_FAILED)
-                except:
-                    pass
-            
-            verified = True
-            break
+                    ConsoleOutput.info(Messages.WARN_OTP_INVALID)
+                    resend = self.page.locator(Selectors.RESEND_BUTTON)
+                    if await resend.count() > 0:
+                        await resend.first.click()
+                        self.otp_requested_at = time.monotonic()
+                        ConsoleOutput.success(Messages.SUCCESS_RESEND_CLICKED)
+                    else:
+                        ConsoleOutput.warn(Messages.WARN_NO_RESEND)
+                    continue
+                
+                verified = True
+                outcome = "verified"
+                break
+        finally:
+            VERIFICATION_ATTEMPTS.observe(attempts, result=outcome)
         
         if not verified:
             raise RuntimeError(Messages.ERROR_VERIFICATION_NO_SUCCESS)
@@ -146,24 +222,17 @@ class SignupBot:
     async def phase_2_agency_details(self):
         ConsoleOutput.section(2, Messages.HEADER_AGENCY)
         
-        await self.page.wait_for_selector(f"input[name='{FieldNames.AGENCY_NAME}']", state="visible", timeout=30000)
+        await self.page.wait_for_selector(f"input[name='{FieldNames.AGENCY_NAME}']", state="visible", timeout=ApplicationConfig.TRANSITION_TIMEOUT_MS)
         
         company = self.profile['company_info']
         
-        await self.page.fill(f"input[name='{FieldNames.AGENCY_NAME}']", company['name'])
-        ConsoleOutput.success(f"{FieldNames.AGENCY_NAME} = {company['name']}")
-        
-        await self.page.fill(f"input[name='{FieldNames.ROLE_IN_AGENCY}']", company['position'])
-        ConsoleOutput.success(f"{FieldNames.ROLE_IN_AGENCY} = {company['position']}")
-        
-        await self.page.fill(f"input[name='{FieldNames.AGENCY_EMAIL}']", company['email'])
-        ConsoleOutput.success(f"{FieldNames.AGENCY_EMAIL} = {company['email']}")
-        
-        await self.page.fill(f"input[name='{FieldNames.AGENCY_WEBSITE}']", company['website'])
-        ConsoleOutput.success(f"{FieldNames.AGENCY_WEBSITE} = {company['website']}")
-        
-        await self.page.fill(f"input[name='{FieldNames.AGENCY_ADDRESS}']", company['address'])
-        ConsoleOutput.success(f"{FieldNames.AGENCY_ADDRESS} = {company['address']}")
+        await self.fill_fields({
+            FieldNames.AGENCY_NAME: company['name'],
+            FieldNames.ROLE_IN_AGENCY: company['position'],
+            FieldNames.AGENCY_EMAIL: company['email'],
+            FieldNames.AGENCY_WEBSITE: company['website'],
+            FieldNames.AGENCY_ADDRESS: company['address']
+        })
         
         ConsoleOutput.info(Messages.INFO_DISCOVERING_REGIONS)
         region_combo = self.page.locator(Selectors.COMBOBOX_BUTTON)
@@ -176,11 +245,10 @@ class SignupBot:
             selected = company['regions']
         
         ConsoleOutput.info(f"{Messages.INFO_SELECTED_REGIONS} {selected}")
-        await FormInteractor.select_dialog_items(self.page, region_combo, selected)
+        await FormInteractor.select_dialog_items(self.page, region_combo, selected, self.selectors)
         
-        await self.page.locator(Selectors.SUBMIT_BUTTON).click()
+        await self.submit_step(Messages.HEADER_AGENCY, self.page.locator(Selectors.SUBMIT_BUTTON), f"input[name='{FieldNames.STUDENTS_RECRUITED}']")
         ConsoleOutput.success(Messages.SUCCESS_AGENCY_SUBMITTED)
-        await DelayController.natural_wait(self.page, 5000)
     
     async def phase_3_professional_experience(self):
         ConsoleOutput.section(3, Messages.HEADER_EXPERIENCE)
@@ -200,23 +268,23 @@ class SignupBot:
         await exp_combo.click()
         await DelayController.natural_wait(self.page, 1000)
         
-        exp_option = self.page.locator(f"[role='option']:has-text('{selected_exp}')")
-        if await exp_option.count() > 0:
-            await exp_option.first.click()
-        else:
-            await self.page.get_by_text(selected_exp, exact=False).first.click()
+        exp_option = await self.selectors.resolve("experience_option", [
+            ("role_option", self.page.locator(f"{Selectors.ROLE_OPTION}:has-text('{selected_exp}')")),
+            ("get_by_text", self.page.get_by_text(selected_exp, exact=False)),
+        ])
+        if exp_option is None:
+            exp_option = self.page.get_by_text(selected_exp, exact=False)
+        
+        await exp_option.first.click()
         
         ConsoleOutput.success(f"Years of Experience = {selected_exp}")
         await DelayController.natural_wait(self.page, 500)
         
-        await self.page.fill(f"input[name='{FieldNames.STUDENTS_RECRUITED}']", background['students'])
-        ConsoleOutput.success(f"{FieldNames.STUDENTS_RECRUITED} = {background['students']}")
-        
-        await self.page.fill(f"input[name='{FieldNames.FOCUS_AREA}']", background['specialty'])
-        ConsoleOutput.success(f"{FieldNames.FOCUS_AREA} = {background['specialty']}")
-        
-        await self.page.fill(f"input[name='{FieldNames.SUCCESS_METRICS}']", background['success'])
-        ConsoleOutput.success(f"{FieldNames.SUCCESS_METRICS} = {background['success']}")
+        await self.fill_fields({
+            FieldNames.STUDENTS_RECRUITED: background['students'],
+            FieldNames.FOCUS_AREA: background['specialty'],
+            FieldNames.SUCCESS_METRICS: background['success']
+        })
         
         ConsoleOutput.info(Messages.INFO_DISCOVERING_SERVICES)
         available_services = await ElementFinder.find_checkbox_options(self.page)
@@ -228,21 +296,17 @@ class SignupBot:
             selected_services = background['services']
         
         ConsoleOutput.info(f"{Messages.INFO_SELECTED_SERVICES} {selected_services}")
-        await FormInteractor.check_boxes(self.page, selected_services)
+        await InputStrategies.check_boxes(self.page, self.selectors, selected_services)
         
-        await self.page.locator(Selectors.SUBMIT_BUTTON).click()
+        await self.submit_step(Messages.HEADER_EXPERIENCE, self.page.locator(Selectors.SUBMIT_BUTTON), f"input[name='{FieldNames.BUSINESS_REG_NUMBER}']")
         ConsoleOutput.success(Messages.SUCCESS_EXPERIENCE_SUBMITTED)
-        await DelayController.natural_wait(self.page, 5000)
     
     async def phase_4_verification(self):
         ConsoleOutput.section(4, Messages.HEADER_VERIFICATION)
         
-        await self.page.wait_for_selector(f"input[name='{FieldNames.BUSINESS_REG_NUMBER}']", state="visible", timeout=15000)
-        
         validation = self.profile['validation']
         
-        await self.page.fill(f"input[name='{FieldNames.BUSINESS_REG_NUMBER}']", validation['reg_num'])
-        ConsoleOutput.success(f"{FieldNames.BUSINESS_REG_NUMBER} = {validation['reg_num']}")
+        await self.fill_fields({FieldNames.BUSINESS_REG_NUMBER: validation['reg_num']})
         
         ConsoleOutput.info(Messages.INFO_DISCOVERING_COUNTRIES)
         country_combo = self.page.locator(Selectors.COMBOBOX_BUTTON)
@@ -255,7 +319,7 @@ class SignupBot:
             selected = validation['countries']
         
         ConsoleOutput.info(f"{Messages.INFO_SELECTED_COUNTRIES} {selected}")
-        await FormInteractor.select_dialog_items(self.page, country_combo, selected)
+        await FormInteractor.select_dialog_items(self.page, country_combo, selected, self.selectors)
         
         ConsoleOutput.info(Messages.INFO_DISCOVERING_INSTITUTIONS)
         available_inst = await ElementFinder.find_checkbox_options(self.page)
@@ -267,10 +331,9 @@ class SignupBot:
             selected_inst = validation['institutions']
         
         ConsoleOutput.info(f"{Messages.INFO_SELECTED_INSTITUTIONS} {selected_inst}")
-        await FormInteractor.check_boxes(self.page, selected_inst)
+        await InputStrategies.check_boxes(self.page, self.selectors, selected_inst)
         
-        await self.page.fill(f"input[name='{FieldNames.CERTIFICATION_DETAILS}']", validation['certs'])
-        ConsoleOutput.success(f"{FieldNames.CERTIFICATION_DETAILS} = {validation['certs']}")
+        await self.fill_fields({FieldNames.CERTIFICATION_DETAILS: validation['certs']})
         
         ConsoleOutput.info(Messages.INFO_UPLOADING_DOCS)
         doc_path = FileManager.create_temp_document(self.profile)
@@ -289,13 +352,15 @@ class SignupBot:
             ConsoleOutput.success(Messages.SUCCESS_DOCUMENTS_CLICKED)
             await DelayController.natural_wait(self.page, 1000)
         
-        submit = self.page.locator(Selectors.FINAL_SUBMIT_BUTTON)
-        if await submit.count() == 0:
+        submit = await self.selectors.resolve("final_submit", [
+            ("final_submit", self.page.locator(Selectors.FINAL_SUBMIT_BUTTON)),
+            ("last_submit", self.page.locator(Selectors.SUBMIT_BUTTON).last),
+        ])
+        if submit is None:
             submit = self.page.locator(Selectors.SUBMIT_BUTTON).last
         
-        await submit.click()
+        await self.submit_step(Messages.HEADER_VERIFICATION, submit, expect_url_change=True)
         ConsoleOutput.success(Messages.SUCCESS_FINAL_SUBMIT)
-        await DelayController.natural_wait(self.page, 5000)
         
         final_url = self.page.url
         content = await self.page.locator(Selectors.BODY_ELEMENT).inner_text()
@@ -311,13 +376,28 @@ class SignupBot:
         
         FileManager.cleanup(doc_path)
     
+    def phases(self):
+        return [
+            ("accept_terms", self.phase_0_accept_terms),
+            ("create_account", self.phase_1_create_account),
+            ("verify_otp", self.phase_1b_verify_otp),
+            ("agency_details", self.phase_2_agency_details),
+            ("professional_experience", self.phase_3_professional_experience),
+            ("verification", self.phase_4_verification)
+        ]
+    
     async def run_workflow(self):
         try:
-            await self.phase_0_accept_terms()
-            await self.phase_1_create_account()
-            await self.phase_1b_verify_otp()
-            await self.phase_2_agency_details()
-            await self.phase_3_professional_experience()
-            await self.phase_4_verification()
+            for phase, step in self.phases():
+                started = time.monotonic()
+                try:
+                    async with track_phase(phase):
+                        await step()
+                except Exception:
+                    self.failed_phase = phase
+                    raise
+                finally:
+                    self.phase_timings[phase] = time.monotonic() - started
         finally:
-            await self.teardown()
\ No newline at end of file
+            await self.teardown()
+            self.selectors.save()
\ No newline at end of file
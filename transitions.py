@@ -0,0 +1,106 @@
+import asyncio
+import time
+from config import ApplicationConfig, Patterns, Selectors
+from metrics import TRANSITION_SECONDS
+
+MARK_EXISTING_ALERTS = """
+(selector) => {
+    for (const el of document.querySelectorAll(selector)) {
+        el.dataset.transitionSeen = "1";
+    }
+}
+"""
+
+FIND_ERROR_ALERT = """
+([selector, keywords]) => {
+    for (const el of document.querySelectorAll(selector)) {
+        if (el.dataset.transitionSeen) continue;
+        const text = (el.innerText || "").trim();
+        const lower = text.toLowerCase();
+        if (text && keywords.some((kw) => lower.includes(kw))) return text;
+    }
+    return null;
+}
+"""
+
+class TransitionOutcome:
+    ADVANCED = "advanced"
+    URL_CHANGED = "url_changed"
+    ERROR = "error"
+    TIMEOUT = "timeout"
+
+class TransitionResult:
+    def __init__(self, outcome, elapsed, detail=None):
+        self.outcome = outcome
+        self.elapsed = elapsed
+        self.detail = detail
+    
+    @property
+    def ok(self):
+        return self.outcome in (TransitionOutcome.ADVANCED, TransitionOutcome.URL_CHANGED)
+    
+    def __repr__(self):
+        return f"TransitionResult({self.outcome!r}, {self.elapsed:.2f}s, {self.detail!r})"
+
+class TransitionDetector:
+    @staticmethod
+    async def watch_marker(page, marker, timeout):
+        await page.locator(marker).first.wait_for(state="visible", timeout=timeout)
+        return marker
+    
+    @staticmethod
+    async def watch_url(page, start_url, timeout):
+        await page.wait_for_url(lambda url: url != start_url, timeout=timeout)
+        return page.url
+    
+    @staticmethod
+    async def watch_error(page, timeout):
+        handle = await page.wait_for_function(
+            FIND_ERROR_ALERT,
+            arg=[Selectors.ERROR_ALERT, Patterns.ALERT_ERROR_KEYWORDS],
+            timeout=timeout
+        )
+        return await handle.json_value()
+    
+    @staticmethod
+    async def race(page, marker=None, start_url=None, timeout=ApplicationConfig.TRANSITION_TIMEOUT_MS):
+        started = time.monotonic()
+        watchers = {}
+        
+        if marker:
+            watchers[asyncio.ensure_future(TransitionDetector.watch_marker(page, marker, timeout))] = TransitionOutcome.ADVANCED
+        if start_url:
+            watchers[asyncio.ensure_future(TransitionDetector.watch_url(page, start_url, timeout))] = TransitionOutcome.URL_CHANGED
+        watchers[asyncio.ensure_future(TransitionDetector.watch_error(page, timeout))] = TransitionOutcome.ERROR
+        
+        pending = set(watchers)
+        result = None
+        
+        try:
+            while pending and result is None:
+                done, pending = await asyncio.wait(pending, timeout=timeout / 1000 + 1, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+                
+                for task in sorted(done, key=lambda t: watchers[t] != TransitionOutcome.ERROR):
+                    if task.exception() is None:
+                        result = TransitionResult(watchers[task], time.monotonic() - started, task.result())
+                        break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        if result is None:
+            result = TransitionResult(TransitionOutcome.TIMEOUT, time.monotonic() - started)
+        
+        TRANSITION_SECONDS.observe(result.elapsed, outcome=result.outcome)
+        return result
+    
+    @staticmethod
+    async def submit(page, button, marker=None, expect_url_change=False, timeout=ApplicationConfig.TRANSITION_TIMEOUT_MS):
+        await page.evaluate(MARK_EXISTING_ALERTS, Selectors.ERROR_ALERT)
+        start_url = page.url if expect_url_change else None
+        
+        await button.click()
+        return await TransitionDetector.race(page, marker, start_url, timeout)
@@ -4,7 +4,9 @@ import string
 import time
 import re
 import os
+import json
 from config import ApplicationConfig, DataPools, Messages, Patterns, Selectors
+from metrics import OTP_DELIVERY_SECONDS
 
 class ConsoleOutput:
     @staticmethod
@@ -40,6 +42,16 @@ class ConsoleOutput:
         print(f"#  {Messages.FINAL_SUCCESS}")
         print(f"{sep}")
     
+    @staticmethod
+    def stats_table(rows):
+        sep = "=" * ApplicationConfig.SEPARATOR_LENGTH
+        print(f"\n{sep}")
+        print(f"  {Messages.HEADER_SELECTOR_STATS}")
+        print(f"{sep}")
+        for key, label, hits, tries in rows:
+            rate = 100.0 * hits / tries if tries else 0.0
+            print(f"  {key:<20} {label:<16} {hits:>5}/{tries:<5} {rate:6.1f}%")
+    
     @staticmethod
     def final_footer():
         sep = "═" * ApplicationConfig.SEPARATOR_LENGTH
@@ -69,8 +81,9 @@ def generate_password(length=14):
 
 class ProfileBuilder:
     @staticmethod
-    def build():
-        ts = ApplicationConfig.TIMESTAMP
+    def build(ts=None):
+        if ts is None:
+            ts = ApplicationConfig.TIMESTAMP
         
         return {
             'user_info': {
@@ -146,6 +159,116 @@ class FileManager:
         except OSError:
             pass
 
+class JsonStore:
+    @staticmethod
+    def path_for(filename):
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+    
+    @staticmethod
+    def load(filename):
+        try:
+            with open(JsonStore.path_for(filename)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            ConsoleOutput.warn(f"{Messages.WARN_CACHE_UNREADABLE.format(name=filename)} {e}")
+            return {}
+    
+    @staticmethod
+    def save(filename, data):
+        path = JsonStore.path_for(filename)
+        tmp_path = f"{path}.tmp"
+        
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        
+        os.replace(tmp_path, path)
+
+class SelectorRegistry:
+    def __init__(self, filename=ApplicationConfig.SELECTOR_STATS_FILE):
+        self.filename = filename
+        self.stats = JsonStore.load(filename)
+    
+    def hit_rate(self, key, label):
+        entry = self.stats.get(key, {}).get(label, {})
+        tries = entry.get("tries", 0)
+        return entry.get("hits", 0) / tries if tries else None
+    
+    def total_tries(self, key):
+        return sum(entry.get("tries", 0) for entry in self.stats.get(key, {}).values())
+    
+    def is_unreliable(self, key, label):
+        entry = self.stats.get(key, {}).get(label, {})
+        if entry.get("tries", 0) < ApplicationConfig.SELECTOR_MIN_TRIES:
+            return False
+        if self.total_tries(key) - entry.get("tried_at", 0) >= ApplicationConfig.SELECTOR_REPROBE_INTERVAL:
+            return False
+        return self.hit_rate(key, label) < ApplicationConfig.SELECTOR_DEMOTE_RATE
+    
+    def ranked(self, key, labels):
+        demoted = [label for label in labels if self.is_unreliable(key, label)]
+        return [label for label in labels if label not in demoted] + demoted
+    
+    def record(self, key, label, success):
+        entry = self.stats.setdefault(key, {}).setdefault(label, {"hits": 0, "tries": 0})
+        entry["tries"] += 1
+        entry["tried_at"] = self.total_tries(key)
+        if success:
+            entry["hits"] += 1
+    
+    async def resolve(self, key, candidates):
+        lookup = dict(candidates)
+        
+        for label in self.ranked(key, [label for label, _ in candidates]):
+            locator = lookup[label]
+            found = await locator.count() > 0
+            self.record(key, label, found)
+            
+            if found:
+                return locator
+        
+        return None
+    
+    def report(self):
+        rows = []
+        for key in sorted(self.stats):
+            for label in sorted(self.stats[key], key=lambda label: -(self.hit_rate(key, label) or 0)):
+                entry = self.stats[key][label]
+                rows.append((key, label, entry["hits"], entry["tries"]))
+        return rows
+    
+    def save(self):
+        try:
+            JsonStore.save(self.filename, self.stats)
+        except OSError as e:
+            ConsoleOutput.warn(f"{self.filename}: {e}")
+
+class NavigationCache:
+    def __init__(self, filename=ApplicationConfig.NAVIGATION_CACHE_FILE):
+        self.filename = filename
+        self.entries = JsonStore.load(filename)
+    
+    def get(self, target):
+        return self.entries.get(target)
+    
+    def store(self, target, registration_url):
+        self.entries[target] = {
+            'registration_url': registration_url,
+            'discovered_at': int(time.time())
+        }
+        self.save()
+    
+    def invalidate(self, target):
+        if self.entries.pop(target, None) is not None:
+            self.save()
+    
+    def save(self):
+        try:
+            JsonStore.save(self.filename, self.entries)
+        except OSError as e:
+            ConsoleOutput.warn(f"{self.filename}: {e}")
+
 class ElementFinder:
     @staticmethod
     async def find_dialog_options(page, trigger):
@@ -207,7 +330,7 @@ class ElementFinder:
 
 class FormInteractor:
     @staticmethod
-    async def select_dialog_items(page, trigger, selections):
+    async def select_dialog_items(page, trigger, selections, registry):
         await trigger.click()
         await DelayController.natural_wait(page, 1000)
         
@@ -215,11 +338,12 @@ class FormInteractor:
         await dialog.wait_for(state="visible", timeout=5000)
         
         for item in selections:
-            elem = dialog.locator(f"span:text-is('{item}')")
-            if await elem.count() == 0:
-                elem = dialog.get_by_text(item, exact=False)
+            elem = await registry.resolve("dialog_item", [
+                ("span_text_is", dialog.locator(f"span:text-is('{item}')")),
+                ("get_by_text", dialog.get_by_text(item, exact=False)),
+            ])
             
-            if await elem.count() > 0:
+            if elem is not None:
                 await elem.first.click()
                 ConsoleOutput.success(f"    [x] {item}")
                 await DelayController.natural_wait(page, 300)
@@ -228,33 +352,12 @@ class FormInteractor:
         
         await page.keyboard.press("Escape")
         await DelayController.natural_wait(page, 500)
-    
-    @staticmethod
-    async def check_boxes(page, selections):
-        for item in selections:
-            label = page.locator(f"label:has-text('{item}')").first
-            
-            if await label.count() == 0:
-                ConsoleOutput.warn(Messages.WARN_CHECKBOX_NOT_FOUND.format(text=item))
-                continue
-            
-            parent = label.locator("..")
-            checkbox = parent.locator(Selectors.CHECKBOX_BUTTON)
-            
-            if await checkbox.count() > 0:
-                await checkbox.click()
-            else:
-                await label.click()
-            
-            ConsoleOutput.success(f"    [x] {item}")
-            await DelayController.natural_wait(page, 300)
 
 class EmailReader:
     @staticmethod
-    async def fetch_otp(browser, username):
+    async def fetch_otp(page, username, requested_at=None):
         inbox_url = f"{ApplicationConfig.MAILINATOR_INBOX_URL}{username}"
-        context = await browser.new_context()
-        page = await context.new_page()
+        started = requested_at if requested_at is not None else time.monotonic()
         code = None
         
         for attempt in range(1, ApplicationConfig.MAX_OTP_RETRIES + 1):
@@ -305,6 +408,7 @@ class EmailReader:
                     code = OTPExtractor.find_code(email_body)
                     if code:
                         ConsoleOutput.success(f"OTP retrieved: {code}")
+                        OTP_DELIVERY_SECONDS.observe(time.monotonic() - started)
                         break
                     else:
                         ConsoleOutput.warn(f"Attempt {attempt}: {Messages.WARN_NO_OTP}")
@@ -316,8 +420,6 @@ class EmailReader:
             
             await DelayController.natural_wait(page, ApplicationConfig.OTP_RETRY_INTERVAL * 1000)
         
-        await context.close()
-        
         if code is None:
             raise RuntimeError(Messages.ERROR_NO_OTP)
         